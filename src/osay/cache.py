@@ -1,27 +1,129 @@
 """Audio cache management for osay."""
 
+import os
+import sys
 import json
+import time
+import atexit
 import hashlib
+import sqlite3
+import functools
+import contextlib
 import subprocess
-from typing import Any
+from typing import Any, NoReturn
 from pathlib import Path
 from datetime import datetime
+from collections.abc import Generator
 
 CACHE_DIR = Path.home() / '.osay' / 'audios'
+INDEX_NAME = 'index.sqlite'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    id TEXT PRIMARY KEY,
+    ts REAL NOT NULL,
+    text TEXT NOT NULL,
+    voice TEXT,
+    format TEXT,
+    provider TEXT,
+    instructions TEXT,
+    audio_file TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_ts ON cache (ts);
+"""
+
+_COLUMNS = 'id, ts, text, voice, format, provider, instructions, audio_file'
+
+
+def wait_at_exit(proc: subprocess.Popen[bytes]) -> None:
+    """Let a player keep running and wait for it when the interpreter exits."""
+
+    def _wait() -> None:
+        try:
+            proc.wait()
+        except KeyboardInterrupt:
+            proc.terminate()
+
+    atexit.register(_wait)
+
+
+def play_audio_file(audio_path: Path | str) -> None:
+    """Start afplay without blocking the caller."""
+    wait_at_exit(subprocess.Popen(['afplay', str(audio_path)]))
+
+
+def exec_audio_file(audio_path: Path | str) -> NoReturn:
+    """Replace the current process with afplay.
+
+    Skips the fork and the interpreter teardown when playback is the last
+    thing left to do. Raises OSError if afplay cannot be executed.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp('afplay', ['afplay', str(audio_path)])
+
+
+@functools.cache
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process."""
+    path.mkdir(parents=True, exist_ok=True)
 
 
 class AudioCache:
-    """Manages caching of audio files with metadata."""
+    """Manages caching of audio files with metadata.
+
+    Metadata lives in a single SQLite index next to the audio files, so
+    listing, lookup and expiry are indexed queries instead of directory scans.
+    """
 
     def __init__(
         self,
         cleanup_enabled: bool | None = None,
         cache_expire_days: int | None = None,
     ) -> None:
-        """Initialize cache directory."""
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        """Initialize cache settings.
+
+        Nothing touches the filesystem until the cache is read or written.
+        """
         self._cleanup_enabled = cleanup_enabled
         self._cache_expire_days = cache_expire_days
+        self._conn: sqlite3.Connection | None = None
+        self._cleaned = False
+        # Memoized list_cached() result; dropped whenever the index changes
+        self._list_cache: list[dict[str, Any]] | None = None
+
+    @property
+    def index_path(self) -> Path:
+        """Path to the SQLite metadata index."""
+        return CACHE_DIR / INDEX_NAME
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """Open the metadata index on first use, migrating legacy JSON files."""
+        if self._conn is None:
+            _ensure_dir(CACHE_DIR)
+            is_new = not self.index_path.exists()
+            conn = sqlite3.connect(self.index_path, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            if is_new:
+                self._migrate_json_metadata()
+        return self._conn
+
+    def _has_entries_dir(self) -> bool:
+        """Check whether there can be anything cached, without creating the directory."""
+        return self._conn is not None or CACHE_DIR.is_dir()
+
+    def close(self) -> None:
+        """Close the metadata index if it was opened."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __del__(self) -> None:
+        self.close()
 
     @property
     def cleanup_enabled(self) -> bool:
@@ -47,49 +149,84 @@ class AudioCache:
         Returns:
             Number of files removed.
         """
-        expire_days = self.cache_expire_days
-        removed_count = 0
+        if not self._has_entries_dir():
+            return 0
 
-        for metadata_file in CACHE_DIR.glob('*.json'):
-            metadata = self._load_metadata(metadata_file)
-            if not metadata:
-                continue
+        # An entry expires once it is more than `expire_days` whole days old
+        cutoff = time.time() - (self.cache_expire_days + 1) * 86400
+        rows = self._db.execute(
+            'SELECT id, audio_file FROM cache WHERE ts <= ?', (cutoff,)
+        ).fetchall()
 
-            try:
-                timestamp = datetime.fromisoformat(metadata['timestamp'])
-                age_days = (datetime.now() - timestamp).days
-                if age_days > expire_days:
-                    self._remove_cached(metadata, metadata_file)
-                    removed_count += 1
-            except (KeyError, ValueError):
-                self._remove_cached(metadata, metadata_file)
-                removed_count += 1
+        for row in rows:
+            self._remove_cached(row['id'], row['audio_file'])
 
-        return removed_count
+        return len(rows)
 
     def auto_cleanup(self) -> None:
         """Run cleanup if enabled (called after caching)."""
         if self.cleanup_enabled:
             self.cleanup()
 
-    def _remove_cached(self, metadata: dict[str, Any], metadata_file: Path) -> None:
-        """Remove a cached audio file and its metadata."""
-        audio_name = metadata.get('audio_file', '')
+    def _remove_cached(self, cache_id: str, audio_name: str | None) -> None:
+        """Remove a cached audio file and its index entry."""
         if audio_name:
-            audio_path = CACHE_DIR / audio_name
-            if audio_path.exists():
-                audio_path.unlink()
-        metadata_file.unlink()
+            (CACHE_DIR / audio_name).unlink(missing_ok=True)
+        self._db.execute('DELETE FROM cache WHERE id = ?', (cache_id,))
+        self._list_cache = None
 
     def _load_metadata(self, metadata_file: Path) -> dict[str, Any] | None:
-        """Load metadata from a JSON file."""
+        """Load metadata from a legacy JSON file."""
         try:
-            with open(metadata_file) as f:
-                result: dict[str, Any] = json.load(f)
-                return result
+            result: dict[str, Any] = json.loads(metadata_file.read_bytes())
+            return result
         except Exception:  # noqa: BLE001
             return None
 
+    def _migrate_json_metadata(self) -> None:
+        """Import per-entry JSON metadata from before the SQLite index existed."""
+        with os.scandir(CACHE_DIR) as it:
+            names = [entry.name for entry in it if entry.name.endswith('.json')]
+
+        for name in names:
+            metadata_file = CACHE_DIR / name
+            metadata = self._load_metadata(metadata_file)
+            if metadata and 'id' in metadata and 'audio_file' in metadata:
+                try:
+                    ts = datetime.fromisoformat(metadata['timestamp']).timestamp()
+                except (KeyError, TypeError, ValueError):
+                    # Unparseable timestamps are treated as expired
+                    ts = 0.0
+                self._db.execute(
+                    f'INSERT OR IGNORE INTO cache ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (
+                        metadata['id'],
+                        ts,
+                        metadata.get('text', ''),
+                        metadata.get('voice'),
+                        metadata.get('format'),
+                        metadata.get('provider'),
+                        metadata.get('instructions'),
+                        metadata['audio_file'],
+                    ),
+                )
+                metadata_file.unlink(missing_ok=True)
+            # Unreadable files are left alone, as cleanup() always did
+
+    @staticmethod
+    def _row_to_metadata(row: sqlite3.Row) -> dict[str, Any]:
+        """Convert an index row to the metadata dict exposed to callers."""
+        return {
+            'id': row['id'],
+            'timestamp': datetime.fromtimestamp(row['ts']).isoformat(),
+            'text': row['text'],
+            'voice': row['voice'],
+            'format': row['format'],
+            'provider': row['provider'],
+            'instructions': row['instructions'],
+            'audio_file': row['audio_file'],
+        }
+
     @staticmethod
     def compute_cache_key(
         text: str,
@@ -118,14 +255,13 @@ class AudioCache:
             Metadata dict if cache hit and audio file exists, None otherwise.
         """
         cache_key = self.compute_cache_key(text, voice, fmt, instructions)
-        metadata_file = CACHE_DIR / f'{cache_key}.json'
-        metadata = self._load_metadata(metadata_file)
+        metadata = self.get_by_id(cache_key)
         if not metadata:
             return None
-        audio_path = CACHE_DIR / metadata.get('audio_file', '')
+        audio_path = CACHE_DIR / metadata['audio_file']
         if not audio_path.exists():
-            # Stale metadata -- audio file missing
-            metadata_file.unlink(missing_ok=True)
+            # Stale entry -- audio file missing
+            self._remove_cached(cache_key, None)
             return None
         return metadata
 
@@ -141,10 +277,28 @@ class AudioCache:
         Returns:
             Tuple of (cache_key, file_path).
         """
+        _ensure_dir(CACHE_DIR)
         cache_key = self.compute_cache_key(text, voice, fmt, instructions)
         cached_audio_path = CACHE_DIR / f'{cache_key}.{fmt}'
         return cache_key, str(cached_audio_path)
 
+    @contextlib.contextmanager
+    def staging_path(self, cache_path: str) -> Generator[str]:
+        """Yield a temporary path that replaces `cache_path` once writing succeeds.
+
+        An interrupted synthesis leaves no truncated audio under the real name;
+        the partial file is removed instead.
+        """
+        path = Path(cache_path)
+        # Keep the real extension so tools that infer format from it still work
+        partial = path.with_name(f'{path.stem}.partial{path.suffix}')
+        try:
+            yield str(partial)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        os.replace(partial, path)
+
     def save_metadata(
         self,
         cache_id: str,
@@ -154,55 +308,106 @@ class AudioCache:
         provider: str,
         instructions: str | None = None,
     ) -> None:
-        """Save metadata for a cached audio file."""
-        metadata = {
-            'id': cache_id,
-            'timestamp': datetime.now().isoformat(),
-            'text': text,
-            'voice': voice,
-            'format': fmt,
-            'provider': provider,
-            'instructions': instructions,
-            'audio_file': f'{cache_id}.{fmt}',
-        }
+        """Save metadata for a cached audio file.
 
-        metadata_file = CACHE_DIR / f'{cache_id}.json'
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        The first save on an instance also runs automatic cleanup, so
+        read-only commands never pay for it.
+        """
+        self._db.execute(
+            f'INSERT OR REPLACE INTO cache ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                cache_id,
+                time.time(),
+                text,
+                voice,
+                fmt,
+                provider,
+                instructions,
+                f'{cache_id}.{fmt}',
+            ),
+        )
+        self._list_cache = None
+
+        if not self._cleaned:
+            self._cleaned = True
+            self.auto_cleanup()
 
     def list_cached(self) -> list[dict[str, Any]]:
         """List all cached audio files with metadata, sorted by time."""
-        cached_items: list[dict[str, Any]] = []
-        metadata_files = sorted(CACHE_DIR.glob('*.json'), key=lambda f: f.stat().st_mtime)
-
-        for metadata_file in metadata_files:
-            metadata = self._load_metadata(metadata_file)
-            if metadata:
-                cached_items.append(metadata)
-
-        return cached_items
+        if not self._has_entries_dir():
+            return []
+        if self._list_cache is None:
+            rows = self._db.execute(f'SELECT {_COLUMNS} FROM cache ORDER BY ts ASC').fetchall()
+            self._list_cache = [self._row_to_metadata(row) for row in rows]
+        return list(self._list_cache)
+
+    def latest(self) -> dict[str, Any] | None:
+        """Get the most recently cached item without listing the whole cache."""
+        if self._list_cache is not None:
+            return self._list_cache[-1] if self._list_cache else None
+        if not self._has_entries_dir():
+            return None
+        row = self._db.execute(f'SELECT {_COLUMNS} FROM cache ORDER BY ts DESC LIMIT 1').fetchone()
+        return self._row_to_metadata(row) if row else None
 
     def get_by_id(self, cache_id: str) -> dict[str, Any] | None:
         """Get cached item by ID."""
-        metadata_file = CACHE_DIR / f'{cache_id}.json'
-        return self._load_metadata(metadata_file)
+        if not self._has_entries_dir():
+            return None
+        row = self._db.execute(f'SELECT {_COLUMNS} FROM cache WHERE id = ?', (cache_id,)).fetchone()
+        return self._row_to_metadata(row) if row else None
 
-    def play(self, cache_id: str) -> bool:
+    def play(self, cache_id: str, metadata: dict[str, Any] | None = None) -> bool:
         """Play a cached audio file.
 
+        Args:
+            cache_id: ID of the cached entry.
+            metadata: Entry already fetched by the caller, to skip the lookup.
+
         Returns:
             True if played successfully.
         """
-        metadata = self.get_by_id(cache_id)
-        if not metadata:
+        audio_path = self.audio_path(cache_id, metadata)
+        if audio_path is None:
             return False
 
-        audio_path = CACHE_DIR / metadata['audio_file']
-        if not audio_path.exists():
+        try:
+            play_audio_file(audio_path)
+            return True
+        except OSError:
+            return False
+
+    def play_and_exit(self, cache_id: str, metadata: dict[str, Any] | None = None) -> bool:
+        """Replace the current process with afplay for a cached audio file.
+
+        Only for callers with nothing left to do after playback starts.
+
+        Returns:
+            False if the audio could not be played; otherwise does not return.
+        """
+        audio_path = self.audio_path(cache_id, metadata)
+        if audio_path is None:
             return False
 
         try:
-            subprocess.run(['afplay', str(audio_path)], check=True)
-            return True
-        except subprocess.CalledProcessError:
+            exec_audio_file(audio_path)
+        except OSError:
             return False
+
+    def audio_path(self, cache_id: str, metadata: dict[str, Any] | None = None) -> Path | None:
+        """Resolve the audio file of a cached entry.
+
+        Args:
+            cache_id: ID of the cached entry.
+            metadata: Entry already fetched by the caller, to skip the lookup.
+
+        Returns:
+            Path to the audio file, or None if the entry or file is missing.
+        """
+        if metadata is None:
+            metadata = self.get_by_id(cache_id)
+        if not metadata:
+            return None
+
+        audio_path = CACHE_DIR / metadata['audio_file']
+        return audio_path if audio_path.exists() else None
@@ -4,9 +4,11 @@ import os
 import sys
 import json
 import time
-import argparse
+import shutil
+import functools
+import contextlib
 import subprocess
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from pathlib import Path
 from datetime import datetime
 
@@ -18,9 +20,20 @@ from osay.key import (
     show_key_status,
     setup_api_key_interactive,
 )
-from osay.cache import CACHE_DIR, AudioCache
+from osay.cache import (
+    CACHE_DIR,
+    AudioCache,
+    wait_at_exit,
+    exec_audio_file,
+    play_audio_file,
+)
 from osay.config import Config
-from osay.providers import TTSProvider, MacOSsayProvider, OpenAITTSProvider
+
+if TYPE_CHECKING:
+    import argparse
+
+    # Importing providers pulls in openai; cache-only commands never need it
+    from osay.providers import TTSProvider, OpenAITTSProvider
 
 # Exit codes
 EXIT_OK = 0
@@ -29,32 +42,45 @@ EXIT_NO_INPUT = 2
 EXIT_AUTH_ERROR = 3
 
 
+def _err(message: str) -> None:
+    """Write a status line straight to the stderr byte stream.
+
+    Used on the replay paths, where the whole run is a few milliseconds and
+    the text layer's per-call encoding and line buffering show up.
+    """
+    stream = sys.stderr
+    buffer = getattr(stream, 'buffer', None)
+    if buffer is None:
+        # None or a text-only stream (e.g. a redirected StringIO)
+        print(message, file=stream)
+        return
+    buffer.write(f'{message}\n'.encode(stream.encoding, stream.errors or 'strict'))
+    buffer.flush()
+
+
+@functools.cache
 def _command_exists(cmd: str) -> bool:
     """Check if a command exists on PATH."""
-    return subprocess.run(['which', cmd], capture_output=True).returncode == 0
+    return shutil.which(cmd) is not None
+
 
+def _select_provider(*, quiet: bool = False, verbose: bool = False) -> 'TTSProvider':
+    """Select TTS provider based on available API key.
 
-def _select_provider(*, quiet: bool = False) -> TTSProvider:
-    """Select TTS provider based on available API key."""
-    import openai as _openai
+    The key is not validated up front; an invalid key surfaces as an
+    authentication error from the synthesis call itself.
+    """
+    from osay.providers import MacOSsayProvider, OpenAITTSProvider
 
     api_key = os.environ.get('OPENAI_API_KEY')
     if api_key:
-        try:
-            provider = OpenAITTSProvider(api_key)
-            _openai.OpenAI().models.list()
-            if not quiet:
-                print(
-                    f'Using OpenAI TTS (voices: {", ".join(provider.list_voices())})',
-                    file=sys.stderr,
-                )
-            return provider
-        except Exception:  # noqa: BLE001
-            if not quiet:
-                print(
-                    "OpenAI API key found but invalid, falling back to macOS 'say'",
-                    file=sys.stderr,
-                )
+        provider = OpenAITTSProvider(api_key)
+        if verbose and not quiet:
+            print(
+                f'Using OpenAI TTS (voices: {", ".join(provider.list_voices())})',
+                file=sys.stderr,
+            )
+        return provider
 
     if not quiet:
         print("Using macOS 'say' command", file=sys.stderr)
@@ -63,63 +89,99 @@ def _select_provider(*, quiet: bool = False) -> TTSProvider:
 
 def _play_cached_audio(cache: AudioCache, cache_id: str | None = None) -> None:
     """Play cached audio. If no ID, select interactively with fzf."""
+    metadata: dict[str, Any] | None = None
     if not cache_id:
         if not _command_exists('fzf'):
-            print('Error: fzf is not installed. Install it or provide a cache ID.', file=sys.stderr)
-            print('Install: brew install fzf', file=sys.stderr)
+            _err(
+                'Error: fzf is not installed. Install it or provide a cache ID.\nInstall: brew install fzf'
+            )
             return
 
         cached_items = cache.list_cached()
         if not cached_items:
-            print('No cached audio files found.', file=sys.stderr)
+            _err('No cached audio files found.')
             return
 
+        # The full text rides along as a hidden third field so the preview
+        # is a plain printf instead of a lookup per highlighted line
         fzf_input: list[str] = []
         for item in cached_items:
             time_str = datetime.fromisoformat(item['timestamp']).strftime('%Y-%m-%d %H:%M')
             voice = item['voice'] or 'default'
-            text = item['text'].replace('\n', ' ')
+            full_text = ' '.join(item['text'].split())
+            text = full_text
             if len(text) > 128:
                 text = text[:125] + '...'
-            fzf_input.append(f'{item["id"]}\t{time_str} - {voice} - {text}')
+            fzf_input.append(f'{item["id"]}\t{time_str} - {voice} - {text}\t{full_text}')
 
-        preview_cmd = f'jq -r ".text" {CACHE_DIR}/"$(echo {{}} | cut -f1)".json 2>/dev/null'
         fzf_cmd = [
             'fzf',
             '-d',
             '\t',
             '--with-nth=2',
             '--preview',
-            preview_cmd,
+            "printf '%s' {3}",
             '--preview-window',
-            'up:3:wrap',
+            'up:5:wrap',
         ]
 
         try:
-            process = subprocess.Popen(
-                fzf_cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
-            )
-            stdout, _ = process.communicate('\n'.join(fzf_input))
+            process = subprocess.Popen(fzf_cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            stdout, _ = process.communicate('\n'.join(fzf_input).encode())
 
             if process.returncode != 0:
                 return
 
-            selected = stdout.strip()
+            # Only the single selected line needs decoding
+            selected = stdout.decode().strip()
             if selected:
                 cache_id = selected.split('\t')[0]
+                metadata = next((item for item in cached_items if item['id'] == cache_id), None)
             else:
                 return
         except (subprocess.SubprocessError, OSError):
             return
 
-    if cache.play(cache_id):
-        print(f'Playing cached audio: {cache_id}', file=sys.stderr)
-    else:
-        print(f'Error: Could not play cached audio: {cache_id}', file=sys.stderr)
-
-
-def _build_parser() -> argparse.ArgumentParser:
+    audio_path = cache.audio_path(cache_id, metadata)
+    if audio_path is not None:
+        _err(f'Playing cached audio: {cache_id}')
+        # Playback is the last step, so hand the process over to afplay
+        with contextlib.suppress(OSError):
+            exec_audio_file(audio_path)
+    _err(f'Error: Could not play cached audio: {cache_id}')
+
+
+def _stream_to_cache_and_play(
+    provider: 'OpenAITTSProvider',
+    player: subprocess.Popen[bytes],
+    cache_path: str,
+    text: str,
+    voice: str,
+    instructions: str | None,
+    fmt: str,
+) -> None:
+    """Stream synthesis into the cache file and the player in a single pass.
+
+    Returns once the download finishes; the player keeps going and is
+    waited for at interpreter exit.
+    """
+    assert player.stdin is not None
+    try:
+        with open(cache_path, 'wb') as f:
+            provider.synthesize_streaming(text, [f, player.stdin], voice, instructions, fmt)
+        with contextlib.suppress(BrokenPipeError):
+            player.stdin.close()
+    except BaseException:
+        player.kill()
+        player.wait()
+        raise
+    wait_at_exit(player)
+
+
+def _build_parser() -> 'argparse.ArgumentParser':
     """Build the CLI argument parser."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog='osay',
         description='Text-to-speech using OpenAI API or macOS say',
@@ -150,6 +212,11 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         '--no-cache', action='store_true', help='Disable caching, use live streaming'
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Live-stream sentence by sentence, synthesizing ahead of playback (implies --no-cache)',
+    )
 
     # Cache operations
     parser.add_argument('--list-cached', action='store_true', help='List cached audio files')
@@ -178,6 +245,7 @@ def _build_parser() -> argparse.ArgumentParser:
 
     # Meta
     parser.add_argument('--version', action='version', version=f'osay {osay.__version__}')
+    parser.add_argument('--verbose', action='store_true', help='Show which TTS provider is in use')
     parser.add_argument(
         '--json',
         action='store_true',
@@ -193,8 +261,39 @@ def _json_out(data: dict[str, Any]) -> None:
     print(json.dumps(data, indent=2))
 
 
+def _play_prev(*, json_mode: bool = False) -> None:
+    """Play the most recently cached audio."""
+    cache = AudioCache()
+    latest = cache.latest()
+    if latest is None:
+        if json_mode:
+            _json_out({'error': 'no_cached_audio', 'message': 'No cached audio files found.'})
+        else:
+            _err('No cached audio files found.')
+        sys.exit(EXIT_ERROR)
+    if not json_mode:
+        text_preview = latest['text'][:60] + ('...' if len(latest['text']) > 60 else '')
+        _err(f'Playing: {text_preview}')
+    if json_mode:
+        # JSON is reported after playback starts, so the process has to stay
+        if cache.play(latest['id'], latest):
+            _json_out({'status': 'played', 'id': latest['id']})
+            return
+        msg = f'Could not play cached audio: {latest["id"]}'
+        _json_out({'error': 'playback_error', 'message': msg})
+    else:
+        cache.play_and_exit(latest['id'], latest)
+        _err(f'Error: Could not play cached audio: {latest["id"]}')
+    sys.exit(EXIT_ERROR)
+
+
 def main() -> None:
     """CLI entry point."""
+    # Bare `osay -p` is the replay hotkey; skip building the argparse parser
+    if sys.argv[1:] in (['-p'], ['--prev']):
+        _play_prev()
+        return
+
     parser = _build_parser()
     args = parser.parse_args()
 
@@ -263,21 +362,7 @@ def main() -> None:
         return
 
     if args.prev:
-        cache = AudioCache()
-        cached_items = cache.list_cached()
-        if not cached_items:
-            if json_mode:
-                _json_out({'error': 'no_cached_audio', 'message': 'No cached audio files found.'})
-            else:
-                print('No cached audio files found.', file=sys.stderr)
-            sys.exit(EXIT_ERROR)
-        latest = cached_items[-1]
-        if not json_mode:
-            text_preview = latest['text'][:60] + ('...' if len(latest['text']) > 60 else '')
-            print(f'Playing: {text_preview}', file=sys.stderr)
-        cache.play(latest['id'])
-        if json_mode:
-            _json_out({'status': 'played', 'id': latest['id']})
+        _play_prev(json_mode=json_mode)
         return
 
     if args.play_cached is not None:
@@ -295,9 +380,16 @@ def main() -> None:
         return
 
     # --- TTS synthesis ---
+    from osay.providers import (
+        MacOSsayProvider,
+        OpenAITTSProvider,
+        split_sentences,
+        spawn_pipe_player,
+    )
+
     quiet = not sys.stderr.isatty()
     ensure_api_key()
-    provider = _select_provider(quiet=quiet)
+    provider = _select_provider(quiet=quiet, verbose=args.verbose)
 
     # Validate format with macOS fallback
     if args.format != 'mp3' and not isinstance(provider, OpenAITTSProvider) and not json_mode:
@@ -353,7 +445,7 @@ def main() -> None:
 
     # Cache setting
     config = Config()
-    use_cache = not args.no_cache and config.audio_cache_enabled
+    use_cache = not args.no_cache and not args.incremental and config.audio_cache_enabled
 
     fmt = args.format or 'mp3'
     # macOS say only produces AIFF natively; override format for cache compatibility
@@ -369,24 +461,49 @@ def main() -> None:
             cache_expire_days=config.cache_expire_days if config.audio_cache_enabled else None,
         )
 
-    # Check cache hit before synthesizing
-    if cache is not None and not args.output_file:
+    # Check cache hit before synthesizing; identical input never hits the API twice
+    if cache is not None:
         hit = cache.lookup(text, voice, fmt, instructions)
         if hit:
             audio_path = CACHE_DIR / hit['audio_file']
             if not quiet:
                 print(f'Cache hit: {hit["id"]}', file=sys.stderr)
-            subprocess.run(['afplay', str(audio_path)], check=True)
+            hit_result: dict[str, Any] = {'status': 'ok', 'cache_hit': True, 'id': hit['id']}
+            if args.output_file:
+                try:
+                    # copyfileobj rather than copyfile, which refuses pipes like /dev/stdout
+                    with open(audio_path, 'rb') as src, open(args.output_file, 'wb') as dst:
+                        shutil.copyfileobj(src, dst)
+                except OSError as e:
+                    # Same report as a failed write from synthesis would give
+                    if json_mode:
+                        _json_out({'error': 'synthesis_error', 'message': str(e)})
+                    else:
+                        print(f'Error: {e}', file=sys.stderr)
+                    sys.exit(EXIT_ERROR)
+                hit_result['output_file'] = args.output_file
+            else:
+                play_audio_file(audio_path)
             if json_mode:
-                _json_out({'status': 'ok', 'cache_hit': True, 'id': hit['id']})
+                _json_out(hit_result)
             return
 
+    # Single sentences and a missing ffplay get plain live streaming instead
+    incremental = (
+        args.incremental
+        and isinstance(provider, OpenAITTSProvider)
+        and _command_exists('ffplay')
+        and len(split_sentences(text)) > 1
+    )
+
     # Display playback mode
     if isinstance(provider, OpenAITTSProvider) and not quiet:
         if args.output_file:
             print(f'Mode: File output ({fmt} format)', file=sys.stderr)
         elif use_cache:
             print(f'Mode: Cached playback ({fmt} format)', file=sys.stderr)
+        elif incremental:
+            print('Mode: Incremental streaming (PCM format, sentence by sentence)', file=sys.stderr)
         else:
             print('Mode: Live streaming (PCM format - lowest latency)', file=sys.stderr)
 
@@ -398,8 +515,16 @@ def main() -> None:
             provider.synthesize(text, args.output_file, voice, instructions, args.format)
         elif cache is not None:
             cache_id, cache_path = cache.generate_cache_path(text, voice, fmt, instructions)
-            provider.synthesize(text, cache_path, voice, instructions, args.format)
-            subprocess.run(['afplay', cache_path], check=True)
+            player = spawn_pipe_player(fmt) if isinstance(provider, OpenAITTSProvider) else None
+            if isinstance(provider, OpenAITTSProvider) and player is not None:
+                with cache.staging_path(cache_path) as staging:
+                    _stream_to_cache_and_play(
+                        provider, player, staging, text, voice, instructions, fmt
+                    )
+            else:
+                with cache.staging_path(cache_path) as staging:
+                    provider.synthesize(text, staging, voice, instructions, args.format)
+            # Record the entry while the audio is still playing
             cache.save_metadata(
                 cache_id=cache_id,
                 text=text,
@@ -408,9 +533,12 @@ def main() -> None:
                 provider=provider.__class__.__name__,
                 instructions=instructions,
             )
-            cache.auto_cleanup()
+            if player is None:
+                play_audio_file(cache_path)
             if not quiet:
                 print(f'Cached audio ID: {cache_id}', file=sys.stderr)
+        elif incremental and isinstance(provider, OpenAITTSProvider):
+            provider.synthesize_incremental(text, voice, instructions)
         else:
             provider.synthesize(text, None, voice, instructions, args.format)
     except RuntimeError as e:
@@ -1,12 +1,82 @@
 """TTS provider implementations."""
 
+import os
+import re
+import stat
+import queue
+import shutil
 import asyncio
+import threading
 import subprocess
 from abc import ABC, abstractmethod
+from typing import IO, TYPE_CHECKING, ClassVar
+from functools import cached_property
 
-import openai
-from openai import AsyncOpenAI
-from openai.helpers import LocalAudioPlayer
+if TYPE_CHECKING:
+    # openai pulls in httpx, pydantic, etc.; import it only when a provider is built
+    import openai
+
+# OpenAI emits 24kHz mono signed 16-bit little-endian samples for `pcm`
+PCM_SAMPLE_RATE = 24000
+STREAM_CHUNK_SIZE = 4096
+
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+# Chunks buffered ahead of the player in incremental mode (~5s of PCM)
+INCREMENTAL_QUEUE_SIZE = 64
+
+# ffplay demuxer per response format; naming it up front skips format probing
+FFPLAY_DEMUXERS = {
+    'mp3': 'mp3',
+    'opus': 'ogg',
+    'aac': 'aac',
+    'flac': 'flac',
+    'wav': 'wav',
+    'pcm': 's16le',
+}
+
+
+def spawn_pipe_player(fmt: str) -> subprocess.Popen[bytes] | None:
+    """Spawn ffplay reading audio from stdin with minimal buffering.
+
+    afplay cannot read from a pipe, so ffplay is the only streaming player.
+
+    Returns:
+        The player process, or None if ffplay is not installed.
+    """
+    if shutil.which('ffplay') is None:
+        return None
+
+    cmd = [
+        'ffplay',
+        '-nodisp',
+        '-autoexit',
+        '-loglevel',
+        'quiet',
+        '-fflags',
+        'nobuffer',
+        '-flags',
+        'low_delay',
+        '-probesize',
+        '32',
+        '-analyzeduration',
+        '0',
+    ]
+    demuxer = FFPLAY_DEMUXERS.get(fmt)
+    if demuxer:
+        cmd.extend(['-f', demuxer])
+    if fmt == 'pcm':
+        # Raw PCM has no header, so describe the stream explicitly
+        cmd.extend(['-ar', str(PCM_SAMPLE_RATE), '-ch_layout', 'mono'])
+    cmd.extend(['-i', 'pipe:0'])
+
+    return subprocess.Popen(
+        cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences on terminal punctuation followed by whitespace."""
+    return [sentence for sentence in SENTENCE_BOUNDARY.split(text.strip()) if sentence]
 
 
 class TTSProvider(ABC):
@@ -48,40 +118,102 @@ class OpenAITTSProvider(TTSProvider):
     AUDIO_FORMATS = {'mp3', 'opus', 'aac', 'flac', 'wav', 'pcm'}
     DEFAULT_FORMAT = 'mp3'
 
+    _client: ClassVar['openai.OpenAI | None'] = None
+
     def __init__(self, api_key: str | None = None) -> None:
-        """Initialize with optional API key."""
+        """Initialize with optional API key.
+
+        Clients are created on first use, so constructing the provider is cheap.
+        """
+        import openai
+
+        self._openai = openai
         if api_key:
             openai.api_key = api_key
-        self.client = openai.OpenAI()
-        self.async_client = AsyncOpenAI()
 
-    async def _stream_and_play(
-        self, text: str, voice: str, instructions: str | None = None
-    ) -> None:
-        """Stream audio from OpenAI and play in real-time via LocalAudioPlayer."""
+    @property
+    def client(self) -> 'openai.OpenAI':
+        """Synchronous OpenAI client, shared by all providers in the process.
+
+        Reusing one client reuses its HTTPS connection pool across requests.
+        """
+        cls = type(self)
+        if cls._client is None:
+            cls._client = self._openai.OpenAI()
+        return cls._client
+
+    @cached_property
+    def async_client(self) -> 'openai.AsyncOpenAI':
+        """Asynchronous OpenAI client.
+
+        Kept per instance rather than shared like `client`: its connections
+        belong to the event loop that first used them.
+        """
+        return self._openai.AsyncOpenAI()
+
+    @staticmethod
+    def _speech_kwargs(
+        text: str, voice: str, response_format: str, instructions: str | None = None
+    ) -> dict[str, str]:
+        """Build request arguments for the speech endpoint."""
         kwargs: dict[str, str] = {
             'model': 'gpt-4o-mini-tts',
             'voice': voice,
             'input': text,
-            'response_format': 'pcm',
+            'response_format': response_format,
         }
         if instructions:
             kwargs['instructions'] = instructions
+        return kwargs
 
+    async def _stream_and_play(
+        self, text: str, voice: str, instructions: str | None = None
+    ) -> None:
+        """Stream audio from OpenAI and play via LocalAudioPlayer.
+
+        LocalAudioPlayer buffers the whole response before playing, so this is
+        only used when ffplay is unavailable.
+        """
+        from openai.helpers import LocalAudioPlayer
+
+        kwargs = self._speech_kwargs(text, voice, 'pcm', instructions)
         async with self.async_client.audio.speech.with_streaming_response.create(
             **kwargs  # pyright: ignore[reportArgumentType]
         ) as response:
             await LocalAudioPlayer().play(response)
 
-    def synthesize(
+    def _stream_to_player(
         self,
+        player: subprocess.Popen[bytes],
         text: str,
-        output_file: str | None = None,
-        voice: str | None = None,
+        voice: str,
         instructions: str | None = None,
-        response_format: str | None = None,
     ) -> None:
-        """Synthesize text using OpenAI API."""
+        """Stream PCM audio from OpenAI straight into a player's stdin."""
+        assert player.stdin is not None
+        kwargs = self._speech_kwargs(text, voice, 'pcm', instructions)
+        try:
+            with self.client.audio.speech.with_streaming_response.create(
+                **kwargs  # pyright: ignore[reportArgumentType]
+            ) as response:
+                for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                    player.stdin.write(chunk)
+            player.stdin.close()
+        except BrokenPipeError:
+            # Player was closed by the user; nothing left to play
+            pass
+        except BaseException:
+            player.kill()
+            raise
+        finally:
+            player.wait()
+
+    def _resolve_options(self, voice: str | None, response_format: str | None) -> tuple[str, str]:
+        """Apply defaults and validate voice and format.
+
+        Returns:
+            Tuple of (voice, response_format).
+        """
         if not voice:
             voice = self.DEFAULT_VOICE
 
@@ -96,30 +228,161 @@ class OpenAITTSProvider(TTSProvider):
                 f"Invalid format '{response_format}'. Available: {', '.join(sorted(self.AUDIO_FORMATS))}"
             )
 
+        return voice, response_format
+
+    def _write_stream(
+        self,
+        text: str,
+        sinks: list[IO[bytes]],
+        voice: str,
+        response_format: str,
+        instructions: str | None = None,
+    ) -> None:
+        """Fan each streamed chunk out to every sink that is still accepting data."""
+        active = list(sinks)
+        kwargs = self._speech_kwargs(text, voice, response_format, instructions)
+        with self.client.audio.speech.with_streaming_response.create(
+            **kwargs  # pyright: ignore[reportArgumentType]
+        ) as response:
+            for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                for sink in list(active):
+                    try:
+                        sink.write(chunk)
+                    except BrokenPipeError:
+                        active.remove(sink)
+
+    def synthesize_streaming(
+        self,
+        text: str,
+        sinks: list[IO[bytes]],
+        voice: str | None = None,
+        instructions: str | None = None,
+        response_format: str | None = None,
+    ) -> None:
+        """Synthesize text, writing each streamed chunk to every sink.
+
+        A sink that breaks mid-stream (e.g. a player closed by the user) is
+        dropped; the remaining sinks still receive the full audio.
+        """
+        voice, response_format = self._resolve_options(voice, response_format)
+
+        try:
+            self._write_stream(text, sinks, voice, response_format, instructions)
+        except self._openai.AuthenticationError:
+            raise RuntimeError(
+                'OpenAI API key is invalid or not set. Set OPENAI_API_KEY environment variable.'
+            ) from None
+        except Exception as e:
+            raise RuntimeError(f'OpenAI API error: {e}') from e
+
+    def synthesize(
+        self,
+        text: str,
+        output_file: str | None = None,
+        voice: str | None = None,
+        instructions: str | None = None,
+        response_format: str | None = None,
+    ) -> None:
+        """Synthesize text using OpenAI API."""
+        voice, response_format = self._resolve_options(voice, response_format)
+
         try:
             if output_file:
-                kwargs: dict[str, str] = {
-                    'model': 'gpt-4o-mini-tts',
-                    'voice': voice,
-                    'input': text,
-                    'response_format': response_format,
-                }
-                if instructions:
-                    kwargs['instructions'] = instructions
-
-                with self.client.audio.speech.with_streaming_response.create(
-                    **kwargs  # pyright: ignore[reportArgumentType]
-                ) as response:
-                    response.stream_to_file(output_file)
+                # Written chunk by chunk so the file can be consumed while it grows
+                with open(output_file, 'wb') as f:
+                    self._write_stream(text, [f], voice, response_format, instructions)
+                    f.flush()
+                    # Pipes and FIFOs (e.g. /dev/stdout) reject fsync with EINVAL
+                    if stat.S_ISREG(os.fstat(f.fileno()).st_mode):
+                        os.fsync(f.fileno())
             else:
-                asyncio.run(self._stream_and_play(text, voice, instructions))
+                player = spawn_pipe_player('pcm')
+                if player is not None:
+                    self._stream_to_player(player, text, voice, instructions)
+                else:
+                    asyncio.run(self._stream_and_play(text, voice, instructions))
 
-        except openai.AuthenticationError:
+        except self._openai.AuthenticationError:
+            raise RuntimeError(
+                'OpenAI API key is invalid or not set. Set OPENAI_API_KEY environment variable.'
+            ) from None
+        except Exception as e:
+            raise RuntimeError(f'OpenAI API error: {e}') from e
+
+    def synthesize_incremental(
+        self,
+        text: str,
+        voice: str | None = None,
+        instructions: str | None = None,
+    ) -> None:
+        """Synthesize and play text one sentence at a time.
+
+        A worker thread requests each sentence in turn while the previous one
+        plays, so the first audio only waits on the first sentence. All
+        sentences stream as PCM into a single ffplay pipe, which joins them
+        without gaps. Falls back to `synthesize` for single sentences or when
+        ffplay is unavailable.
+        """
+        voice, _ = self._resolve_options(voice, 'pcm')
+        sentences = split_sentences(text)
+        player = spawn_pipe_player('pcm') if len(sentences) > 1 else None
+        if player is None:
+            self.synthesize(text, None, voice, instructions)
+            return
+
+        assert player.stdin is not None
+        chunks: queue.Queue[bytes | Exception | None] = queue.Queue(INCREMENTAL_QUEUE_SIZE)
+        stop = threading.Event()
+
+        def put(item: bytes | Exception | None) -> bool:
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for sentence in sentences:
+                    kwargs = self._speech_kwargs(sentence, voice, 'pcm', instructions)
+                    with self.client.audio.speech.with_streaming_response.create(
+                        **kwargs  # pyright: ignore[reportArgumentType]
+                    ) as response:
+                        for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                            if not put(chunk):
+                                return
+            except Exception as e:  # noqa: BLE001 -- re-raised on the main thread
+                put(e)
+                return
+            put(None)
+
+        worker = threading.Thread(target=produce, daemon=True)
+        worker.start()
+        try:
+            while (item := chunks.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                player.stdin.write(item)
+            player.stdin.close()
+        except BrokenPipeError:
+            # Player was closed by the user; nothing left to play
+            pass
+        except self._openai.AuthenticationError:
+            player.kill()
             raise RuntimeError(
                 'OpenAI API key is invalid or not set. Set OPENAI_API_KEY environment variable.'
             ) from None
         except Exception as e:
+            player.kill()
             raise RuntimeError(f'OpenAI API error: {e}') from e
+        except BaseException:
+            player.kill()
+            raise
+        finally:
+            stop.set()
+            player.wait()
 
     def list_voices(self) -> list[str]:
         """Return list of available OpenAI voices."""
@@ -5,6 +5,8 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
+import pytest
+
 from osay.cache import AudioCache
 
 
@@ -15,8 +17,9 @@ class TestAudioCache:
 
     def test_generate_cache_path_deterministic(self, tmp_path: Path):
         cache = self._make_cache(tmp_path)
-        id1, path1 = cache.generate_cache_path('hello', 'onyx', 'mp3', 'cheerful')
-        id2, path2 = cache.generate_cache_path('hello', 'onyx', 'mp3', 'cheerful')
+        with patch('osay.cache.CACHE_DIR', tmp_path):
+            id1, path1 = cache.generate_cache_path('hello', 'onyx', 'mp3', 'cheerful')
+            id2, path2 = cache.generate_cache_path('hello', 'onyx', 'mp3', 'cheerful')
         assert id1 == id2
         assert path1 == path2
         assert len(id1) == 12
@@ -24,9 +27,10 @@ class TestAudioCache:
 
     def test_generate_cache_path_varies_with_input(self, tmp_path: Path):
         cache = self._make_cache(tmp_path)
-        id1, _ = cache.generate_cache_path('hello', 'onyx', 'mp3')
-        id2, _ = cache.generate_cache_path('hello', 'coral', 'mp3')
-        id3, _ = cache.generate_cache_path('world', 'onyx', 'mp3')
+        with patch('osay.cache.CACHE_DIR', tmp_path):
+            id1, _ = cache.generate_cache_path('hello', 'onyx', 'mp3')
+            id2, _ = cache.generate_cache_path('hello', 'coral', 'mp3')
+            id3, _ = cache.generate_cache_path('world', 'onyx', 'mp3')
         assert id1 != id2
         assert id1 != id3
 
@@ -109,7 +113,7 @@ class TestAudioCache:
             hit = cache.lookup('hello', 'onyx', 'mp3')
             assert hit is None
             # Metadata should also be cleaned up
-            assert not (tmp_path / f'{cache_id}.json').exists()
+            assert cache.get_by_id(cache_id) is None
 
     def test_get_by_id(self, tmp_path: Path):
         with patch('osay.cache.CACHE_DIR', tmp_path):
@@ -164,10 +168,163 @@ class TestAudioCache:
 
             removed = cache.cleanup()
             assert removed == 1
-            assert not (tmp_path / 'old00001.json').exists()
             assert not (tmp_path / 'old00001.mp3').exists()
-            assert (tmp_path / 'new00001.json').exists()
             assert (tmp_path / 'new00001.mp3').exists()
+            assert cache.get_by_id('old00001') is None
+            assert cache.get_by_id('new00001') is not None
+
+    def test_legacy_json_metadata_is_migrated(self, tmp_path: Path):
+        with patch('osay.cache.CACHE_DIR', tmp_path):
+            metadata = {
+                'id': 'abc123',
+                'timestamp': datetime.now().isoformat(),
+                'text': 'legacy',
+                'voice': 'onyx',
+                'format': 'mp3',
+                'provider': 'test',
+                'instructions': None,
+                'audio_file': 'abc123.mp3',
+            }
+            (tmp_path / 'abc123.json').write_text(json.dumps(metadata))
+            (tmp_path / 'abc123.mp3').write_bytes(b'audio')
+
+            cache = self._make_cache(tmp_path)
+            items = cache.list_cached()
+            assert [item['id'] for item in items] == ['abc123']
+            assert items[0]['text'] == 'legacy'
+            assert not (tmp_path / 'abc123.json').exists()
+
+    def test_unparseable_legacy_json_is_left_alone(self, tmp_path: Path):
+        with patch('osay.cache.CACHE_DIR', tmp_path):
+            (tmp_path / 'bad123.json').write_text('{not json')
+            (tmp_path / 'bad123.mp3').write_bytes(b'audio')
+
+            cache = self._make_cache(tmp_path)
+            assert cache.list_cached() == []
+            assert (tmp_path / 'bad123.json').exists()
+            assert (tmp_path / 'bad123.mp3').exists()
+
+    def test_list_cached_sorted_oldest_first(self, tmp_path: Path):
+        with patch('osay.cache.CACHE_DIR', tmp_path):
+            cache = self._make_cache(tmp_path)
+            for text in ('first', 'second'):
+                cache_id, _ = cache.generate_cache_path(text, 'onyx', 'mp3')
+                cache.save_metadata(
+                    cache_id=cache_id, text=text, voice='onyx', fmt='mp3', provider='test'
+                )
+            assert [item['text'] for item in cache.list_cached()] == ['first', 'second']
+
+    def test_read_only_use_does_not_create_cache_dir(self, tmp_path: Path):
+        cache_dir = tmp_path / 'audios'
+        with patch('osay.cache.CACHE_DIR', cache_dir):
+            cache = AudioCache()
+            assert cache.list_cached() == []
+            assert cache.get_by_id('missing') is None
+            assert cache.cleanup() == 0
+        assert not cache_dir.exists()
+
+    def test_save_metadata_runs_auto_cleanup_once(self, tmp_path: Path):
+        with (
+            patch('osay.cache.CACHE_DIR', tmp_path),
+            patch.object(AudioCache, 'cleanup', return_value=0) as mock_cleanup,
+        ):
+            cache = self._make_cache(tmp_path, cleanup_enabled=True)
+            for text in ('one', 'two'):
+                cache_id, _ = cache.generate_cache_path(text, 'onyx', 'mp3')
+                cache.save_metadata(
+                    cache_id=cache_id, text=text, voice='onyx', fmt='mp3', provider='test'
+                )
+        mock_cleanup.assert_called_once()
+
+    def test_staging_path_replaces_on_success(self, tmp_path: Path):
+        cache = self._make_cache(tmp_path)
+        target = tmp_path / 'abc.mp3'
+        target.write_bytes(b'old')
+        with cache.staging_path(str(target)) as staging:
+            assert staging != str(target)
+            Path(staging).write_bytes(b'new')
+            assert target.read_bytes() == b'old'
+        assert target.read_bytes() == b'new'
+        assert not Path(staging).exists()
+
+    def test_staging_path_discards_partial_on_error(self, tmp_path: Path):
+        cache = self._make_cache(tmp_path)
+        target = tmp_path / 'abc.mp3'
+        with pytest.raises(KeyboardInterrupt), cache.staging_path(str(target)) as staging:
+            Path(staging).write_bytes(b'trunc')
+            raise KeyboardInterrupt
+        assert not target.exists()
+        assert not Path(staging).exists()
+
+    def test_play_does_not_block_on_playback(self, tmp_path: Path):
+        with patch('osay.cache.CACHE_DIR', tmp_path):
+            cache = self._make_cache(tmp_path)
+            cache_id, cache_path = cache.generate_cache_path('hi', 'onyx', 'mp3')
+            Path(cache_path).write_bytes(b'audio')
+            cache.save_metadata(
+                cache_id=cache_id, text='hi', voice='onyx', fmt='mp3', provider='test'
+            )
+            with (
+                patch('osay.cache.subprocess.Popen') as mock_popen,
+                patch('osay.cache.atexit.register') as mock_register,
+            ):
+                assert cache.play(cache_id) is True
+        mock_popen.assert_called_once_with(['afplay', cache_path])
+        mock_popen.return_value.wait.assert_not_called()
+        mock_register.assert_called_once()
+
+    def test_play_and_exit_execs_player(self, tmp_path: Path):
+        with patch('osay.cache.CACHE_DIR', tmp_path):
+            cache = self._make_cache(tmp_path)
+            cache_id, cache_path = cache.generate_cache_path('hi', 'onyx', 'mp3')
+            Path(cache_path).write_bytes(b'audio')
+            cache.save_metadata(
+                cache_id=cache_id, text='hi', voice='onyx', fmt='mp3', provider='test'
+            )
+            with patch('osay.cache.os.execvp') as mock_exec:
+                cache.play_and_exit(cache_id)
+        mock_exec.assert_called_once_with('afplay', ['afplay', cache_path])
+
+    def test_play_and_exit_missing_audio_returns_false(self, tmp_path: Path):
+        with patch('osay.cache.CACHE_DIR', tmp_path):
+            cache = self._make_cache(tmp_path)
+            with patch('osay.cache.os.execvp') as mock_exec:
+                assert cache.play_and_exit('missing') is False
+        mock_exec.assert_not_called()
+
+    def test_play_missing_player_returns_false(self, tmp_path: Path):
+        with patch('osay.cache.CACHE_DIR', tmp_path):
+            cache = self._make_cache(tmp_path)
+            cache_id, cache_path = cache.generate_cache_path('hi', 'onyx', 'mp3')
+            Path(cache_path).write_bytes(b'audio')
+            cache.save_metadata(
+                cache_id=cache_id, text='hi', voice='onyx', fmt='mp3', provider='test'
+            )
+            with patch('osay.cache.subprocess.Popen', side_effect=FileNotFoundError):
+                assert cache.play(cache_id) is False
+
+    def test_latest_returns_newest_entry(self, tmp_path: Path):
+        with patch('osay.cache.CACHE_DIR', tmp_path):
+            cache = self._make_cache(tmp_path)
+            assert cache.latest() is None
+            for text in ('first', 'second'):
+                cache_id, _ = cache.generate_cache_path(text, 'onyx', 'mp3')
+                cache.save_metadata(
+                    cache_id=cache_id, text=text, voice='onyx', fmt='mp3', provider='test'
+                )
+            latest = cache.latest()
+            assert latest is not None
+            assert latest['text'] == 'second'
+
+    def test_list_cached_refreshes_after_save(self, tmp_path: Path):
+        with patch('osay.cache.CACHE_DIR', tmp_path):
+            cache = self._make_cache(tmp_path)
+            assert cache.list_cached() == []
+            cache_id, _ = cache.generate_cache_path('hi', 'onyx', 'mp3')
+            cache.save_metadata(
+                cache_id=cache_id, text='hi', voice='onyx', fmt='mp3', provider='test'
+            )
+            assert [item['id'] for item in cache.list_cached()] == [cache_id]
 
     def test_cleanup_no_op_when_disabled(self, tmp_path: Path):
         with patch('osay.cache.CACHE_DIR', tmp_path):
@@ -1,13 +1,28 @@
 """Tests for osay.cli module."""
 
+import io
 import os
+import sys
 import json
+import contextlib
+import subprocess
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from osay.cli import EXIT_NO_INPUT, main, _build_parser
+from osay.cli import (
+    EXIT_ERROR,
+    EXIT_NO_INPUT,
+    _err,
+    main,
+    _build_parser,
+    _command_exists,
+    _select_provider,
+    _play_cached_audio,
+    _stream_to_cache_and_play,
+)
+from osay.providers import MacOSsayProvider, OpenAITTSProvider
 
 
 class TestBuildParser:
@@ -55,6 +70,11 @@ class TestBuildParser:
         args = parser.parse_args(['--no-cache', 'hello'])
         assert args.no_cache is True
 
+    def test_parser_incremental(self):
+        parser = _build_parser()
+        args = parser.parse_args(['--incremental', 'hello'])
+        assert args.incremental is True
+
     def test_parser_cache_operations(self):
         parser = _build_parser()
 
@@ -68,6 +88,126 @@ class TestBuildParser:
         assert args.cleanup is True
 
 
+class TestErr:
+    def test_falls_back_to_text_stream(self):
+        stream = io.StringIO()
+        with contextlib.redirect_stderr(stream):
+            _err('hello')
+        assert stream.getvalue() == 'hello\n'
+
+    def test_tolerates_missing_stderr(self):
+        with patch('sys.stderr', None):
+            _err('hello')
+
+    def test_uses_stream_encoding(self):
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding='ascii', errors='backslashreplace')
+        with patch('sys.stderr', stream):
+            _err('caf\u00e9')
+        assert raw.getvalue() == b'caf\\xe9\n'
+
+
+class TestSelectProvider:
+    def test_openai_provider_without_network_probe(self, capsys):
+        mock_openai = MagicMock()
+        with (
+            patch.dict(os.environ, {'OPENAI_API_KEY': 'sk-test'}),
+            patch.dict(sys.modules, {'openai': mock_openai}),
+        ):
+            provider = _select_provider()
+        assert isinstance(provider, OpenAITTSProvider)
+        mock_openai.OpenAI.assert_not_called()
+        assert capsys.readouterr().err == ''
+
+    def test_verbose_reports_openai_provider(self, capsys):
+        with (
+            patch.dict(os.environ, {'OPENAI_API_KEY': 'sk-test'}),
+            patch.dict(sys.modules, {'openai': MagicMock()}),
+        ):
+            _select_provider(verbose=True)
+        assert 'Using OpenAI TTS' in capsys.readouterr().err
+
+    def test_falls_back_to_say_without_key(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert isinstance(_select_provider(quiet=True), MacOSsayProvider)
+
+
+class TestCommandExists:
+    def test_uses_path_lookup_and_memoizes(self):
+        _command_exists.cache_clear()
+        with patch('osay.cli.shutil.which', return_value='/usr/bin/fzf') as mock_which:
+            assert _command_exists('fzf') is True
+            assert _command_exists('fzf') is True
+        mock_which.assert_called_once_with('fzf')
+        _command_exists.cache_clear()
+
+
+class TestPlayCachedAudio:
+    def test_fzf_preview_uses_embedded_text(self):
+        cache = MagicMock()
+        cache.list_cached.return_value = [
+            {
+                'id': 'abc123',
+                'timestamp': '2026-01-01T10:00:00',
+                'voice': 'onyx',
+                'text': 'line one\nline\ttwo',
+            }
+        ]
+        cache.audio_path.return_value = Path('/cache/abc123.mp3')
+        process = MagicMock(returncode=0)
+        process.communicate.return_value = (b'abc123\tdisplay\tline one line two\n', None)
+        with (
+            patch('osay.cli._command_exists', return_value=True),
+            patch('osay.cli.subprocess.Popen', return_value=process) as mock_popen,
+            patch('osay.cli.exec_audio_file') as mock_exec,
+        ):
+            _play_cached_audio(cache)
+
+        fzf_cmd = mock_popen.call_args.args[0]
+        assert fzf_cmd[fzf_cmd.index('--preview') + 1] == "printf '%s' {3}"
+        fzf_input = process.communicate.call_args.args[0].decode()
+        assert fzf_input.split('\t') == [
+            'abc123',
+            '2026-01-01 10:00 - onyx - line one line two',
+            'line one line two',
+        ]
+        cache.audio_path.assert_called_once_with('abc123', cache.list_cached.return_value[0])
+        mock_exec.assert_called_once_with(Path('/cache/abc123.mp3'))
+
+
+class TestStreamToCacheAndPlay:
+    def test_tees_into_cache_and_player(self, tmp_path: Path):
+        provider = MagicMock()
+        player = MagicMock()
+        player.stdin.close.side_effect = BrokenPipeError
+        cache_path = tmp_path / 'abc.mp3'
+        with patch('osay.cli.wait_at_exit') as mock_wait_at_exit:
+            _stream_to_cache_and_play(
+                provider, player, str(cache_path), 'hello', 'onyx', None, 'mp3'
+            )
+        sinks = provider.synthesize_streaming.call_args.args[1]
+        assert sinks[1] is player.stdin
+        assert cache_path.exists()
+        # A player that exited early is not an error; it is still reaped at exit
+        player.kill.assert_not_called()
+        mock_wait_at_exit.assert_called_once_with(player)
+
+    def test_kills_player_on_error(self, tmp_path: Path):
+        provider = MagicMock()
+        provider.synthesize_streaming.side_effect = RuntimeError('boom')
+        player = MagicMock()
+        with (
+            patch('osay.cli.wait_at_exit') as mock_wait_at_exit,
+            pytest.raises(RuntimeError, match='boom'),
+        ):
+            _stream_to_cache_and_play(
+                provider, player, str(tmp_path / 'abc.mp3'), 'hello', 'onyx', None, 'mp3'
+            )
+        player.kill.assert_called_once()
+        player.wait.assert_called_once()
+        mock_wait_at_exit.assert_not_called()
+
+
 class TestMainKeyManagement:
     def test_setup_direct_key_json(self, tmp_path: Path, capsys):
         fake_dir = tmp_path / 'osay'
@@ -147,6 +287,68 @@ class TestMainCacheOperations:
         out = json.loads(capsys.readouterr().out)
         assert out['items'] == []
 
+    def test_bare_prev_skips_argparse(self, capsys):
+        with (
+            patch('sys.argv', ['osay', '-p']),
+            patch('osay.cli._build_parser') as mock_build,
+            patch('osay.cli.AudioCache') as mock_cache_cls,
+        ):
+            latest = {'id': 'abc123', 'text': 'hello again'}
+            mock_cache_cls.return_value.latest.return_value = latest
+            # A successful play_and_exit never returns; the process becomes afplay
+            mock_cache_cls.return_value.play_and_exit.side_effect = SystemExit(0)
+            with pytest.raises(SystemExit):
+                main()
+        mock_build.assert_not_called()
+        mock_cache_cls.return_value.play_and_exit.assert_called_once_with('abc123', latest)
+        assert 'Playing: hello again' in capsys.readouterr().err
+
+    def test_bare_prev_without_cache_reports_to_stderr(self, capsys):
+        with (
+            patch('sys.argv', ['osay', '--prev']),
+            patch('osay.cli.AudioCache') as mock_cache_cls,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            mock_cache_cls.return_value.latest.return_value = None
+            main()
+        assert exc_info.value.code == EXIT_ERROR
+        captured = capsys.readouterr()
+        assert captured.err == 'No cached audio files found.\n'
+        assert captured.out == ''
+
+    def test_prev_json_uses_parser(self, capsys):
+        with (
+            patch('sys.argv', ['osay', '-p', '--json']),
+            patch('osay.cli.AudioCache') as mock_cache_cls,
+        ):
+            mock_cache_cls.return_value.latest.return_value = {'id': 'abc123', 'text': 'x'}
+            main()
+        assert json.loads(capsys.readouterr().out) == {'status': 'played', 'id': 'abc123'}
+
+    def test_bare_prev_reports_playback_failure(self, capsys):
+        with (
+            patch('sys.argv', ['osay', '-p']),
+            patch('osay.cli.AudioCache') as mock_cache_cls,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            mock_cache_cls.return_value.latest.return_value = {'id': 'abc123', 'text': 'x'}
+            mock_cache_cls.return_value.play_and_exit.return_value = False
+            main()
+        assert exc_info.value.code == EXIT_ERROR
+        assert 'Could not play cached audio: abc123' in capsys.readouterr().err
+
+    def test_prev_json_reports_playback_failure(self, capsys):
+        with (
+            patch('sys.argv', ['osay', '-p', '--json']),
+            patch('osay.cli.AudioCache') as mock_cache_cls,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            mock_cache_cls.return_value.latest.return_value = {'id': 'abc123', 'text': 'x'}
+            mock_cache_cls.return_value.play.return_value = False
+            main()
+        assert exc_info.value.code == EXIT_ERROR
+        assert json.loads(capsys.readouterr().out)['error'] == 'playback_error'
+
     def test_cleanup_json(self, capsys):
         with (
             patch('sys.argv', ['osay', '--cleanup', '--json']),
@@ -157,3 +359,120 @@ class TestMainCacheOperations:
         out = json.loads(capsys.readouterr().out)
         assert out['status'] == 'ok'
         assert out['removed'] == 3
+
+    def test_cache_only_commands_do_not_import_openai(self, tmp_path: Path):
+        script = (
+            'import sys; from osay.cli import main; '
+            "sys.argv = ['osay', '--list-cached', '--json']; main(); "
+            "assert 'openai' not in sys.modules"
+        )
+        env = {**os.environ, 'HOME': str(tmp_path), 'PYTHONPATH': os.pathsep.join(sys.path)}
+        result = subprocess.run(
+            [sys.executable, '-c', script], env=env, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout) == {'items': []}
+
+
+class TestMainSynthesisCache:
+    def test_output_file_served_from_cache_hit(self, tmp_path: Path, capsys):
+        cached = tmp_path / 'abc123.mp3'
+        cached.write_bytes(b'cached audio')
+        output = tmp_path / 'out.mp3'
+        with (
+            patch('sys.argv', ['osay', '--json', '-o', str(output), 'hello']),
+            patch('osay.cli.ensure_api_key', return_value=None),
+            patch('osay.cli._select_provider') as mock_select,
+            patch('osay.cli.CACHE_DIR', tmp_path),
+            patch('osay.cli.AudioCache') as mock_cache_cls,
+        ):
+            mock_cache_cls.return_value.lookup.return_value = {
+                'id': 'abc123',
+                'audio_file': 'abc123.mp3',
+            }
+            main()
+        mock_select.return_value.synthesize.assert_not_called()
+        assert output.read_bytes() == b'cached audio'
+        out = json.loads(capsys.readouterr().out)
+        assert out == {
+            'status': 'ok',
+            'cache_hit': True,
+            'id': 'abc123',
+            'output_file': str(output),
+        }
+
+    @pytest.mark.skipif(not os.path.exists('/dev/fd'), reason='needs /dev/fd')
+    def test_output_file_cache_hit_into_pipe(self, tmp_path: Path):
+        (tmp_path / 'abc123.mp3').write_bytes(b'cached audio')
+        read_fd, write_fd = os.pipe()
+        try:
+            with (
+                patch('sys.argv', ['osay', '-o', f'/dev/fd/{write_fd}', 'hello']),
+                patch('osay.cli.ensure_api_key', return_value=None),
+                patch('osay.cli._select_provider'),
+                patch('osay.cli.CACHE_DIR', tmp_path),
+                patch('osay.cli.AudioCache') as mock_cache_cls,
+            ):
+                mock_cache_cls.return_value.lookup.return_value = {
+                    'id': 'abc123',
+                    'audio_file': 'abc123.mp3',
+                }
+                main()
+            os.close(write_fd)
+            write_fd = -1
+            with os.fdopen(read_fd, 'rb') as reader:
+                read_fd = -1
+                assert reader.read() == b'cached audio'
+        finally:
+            for fd in (read_fd, write_fd):
+                if fd >= 0:
+                    os.close(fd)
+
+    def test_output_file_cache_hit_unwritable_path(self, tmp_path: Path, capsys):
+        (tmp_path / 'abc123.mp3').write_bytes(b'cached audio')
+        output = tmp_path / 'missing' / 'out.mp3'
+        with (
+            patch('sys.argv', ['osay', '--json', '-o', str(output), 'hello']),
+            patch('osay.cli.ensure_api_key', return_value=None),
+            patch('osay.cli._select_provider'),
+            patch('osay.cli.CACHE_DIR', tmp_path),
+            patch('osay.cli.AudioCache') as mock_cache_cls,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            mock_cache_cls.return_value.lookup.return_value = {
+                'id': 'abc123',
+                'audio_file': 'abc123.mp3',
+            }
+            main()
+        assert exc_info.value.code == EXIT_ERROR
+        out = json.loads(capsys.readouterr().out)
+        assert out['error'] == 'synthesis_error'
+        assert str(output) in out['message']
+
+
+class TestMainIncremental:
+    def _run(self, text: str, *, has_ffplay: bool = True) -> MagicMock:
+        provider = MagicMock(spec=OpenAITTSProvider)
+        with (
+            patch('sys.argv', ['osay', '--incremental', text]),
+            patch('osay.cli.ensure_api_key', return_value=None),
+            patch('osay.cli._select_provider', return_value=provider),
+            patch('osay.cli._command_exists', return_value=has_ffplay),
+        ):
+            main()
+        return provider
+
+    def test_multiple_sentences_stream_incrementally(self):
+        provider = self._run('One. Two.')
+        provider.synthesize_incremental.assert_called_once()
+        provider.synthesize.assert_not_called()
+
+    def test_single_sentence_uses_live_streaming(self):
+        provider = self._run('Just one.')
+        provider.synthesize_incremental.assert_not_called()
+        provider.synthesize.assert_called_once()
+
+    def test_without_ffplay_uses_live_streaming(self):
+        provider = self._run('One. Two.', has_ffplay=False)
+        provider.synthesize_incremental.assert_not_called()
+        provider.synthesize.assert_called_once()
@@ -1,18 +1,29 @@
 """Tests for osay.providers module."""
 
+import io
+import os
+import sys
+import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from osay.providers import MacOSsayProvider, OpenAITTSProvider
+from osay.providers import (
+    MacOSsayProvider,
+    OpenAITTSProvider,
+    split_sentences,
+    spawn_pipe_player,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_clients(monkeypatch):
+    monkeypatch.setattr(OpenAITTSProvider, '_client', None)
 
 
 def _make_openai_provider() -> OpenAITTSProvider:
-    """Create an OpenAITTSProvider with mocked clients."""
-    with (
-        patch('osay.providers.openai'),
-        patch('osay.providers.AsyncOpenAI'),
-    ):
+    """Create an OpenAITTSProvider backed by a mocked openai module."""
+    with patch.dict(sys.modules, {'openai': MagicMock()}):
         return OpenAITTSProvider(api_key='sk-test')
 
 
@@ -34,9 +45,181 @@ class TestOpenAITTSProvider:
         assert 'coral' in voices
         assert len(voices) == 10
 
+    def test_clients_created_lazily(self):
+        mock_openai = MagicMock()
+        with patch.dict(sys.modules, {'openai': mock_openai}):
+            provider = OpenAITTSProvider(api_key='sk-test')
+            mock_openai.OpenAI.assert_not_called()
+            assert provider.client is provider.client
+        mock_openai.OpenAI.assert_called_once_with()
+
+    def test_openai_imported_only_when_provider_built(self):
+        script = (
+            'import sys, osay.providers as p; '
+            "assert 'openai' not in sys.modules; "
+            "p.OpenAITTSProvider(); assert 'openai' in sys.modules"
+        )
+        env = {'PYTHONPATH': os.pathsep.join(sys.path)}
+        result = subprocess.run(
+            [sys.executable, '-c', script], env=env, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_client_shared_across_instances(self):
+        mock_openai = MagicMock()
+        with patch.dict(sys.modules, {'openai': mock_openai}):
+            first = OpenAITTSProvider()
+            second = OpenAITTSProvider()
+            assert first.client is second.client
+        mock_openai.OpenAI.assert_called_once_with()
+
+    def test_async_client_not_shared_across_instances(self):
+        mock_openai = MagicMock()
+        mock_openai.AsyncOpenAI.side_effect = lambda: MagicMock()
+        with patch.dict(sys.modules, {'openai': mock_openai}):
+            first = OpenAITTSProvider()
+            second = OpenAITTSProvider()
+            assert first.async_client is first.async_client
+            assert first.async_client is not second.async_client
+
     def test_default_voice_is_alloy(self):
         assert OpenAITTSProvider.DEFAULT_VOICE == 'alloy'
 
+    def test_live_playback_pipes_chunks_to_player(self):
+        provider = _make_openai_provider()
+        response = provider.client.audio.speech.with_streaming_response.create.return_value
+        response.__enter__.return_value.iter_bytes.return_value = [b'ab', b'cd']
+        player = MagicMock()
+        with (
+            patch('osay.providers.spawn_pipe_player', return_value=player),
+            patch('osay.providers.asyncio.run') as mock_run,
+        ):
+            provider.synthesize('hello', voice='onyx')
+        assert [c.args[0] for c in player.stdin.write.call_args_list] == [b'ab', b'cd']
+        player.stdin.close.assert_called_once()
+        player.wait.assert_called_once()
+        mock_run.assert_not_called()
+
+    def test_live_playback_falls_back_without_ffplay(self):
+        provider = _make_openai_provider()
+        with (
+            patch('osay.providers.spawn_pipe_player', return_value=None),
+            patch('osay.providers.asyncio.run') as mock_run,
+        ):
+            provider.synthesize('hello', voice='onyx')
+        mock_run.assert_called_once()
+        mock_run.call_args.args[0].close()
+
+    def test_output_file_written_incrementally(self, tmp_path):
+        provider = _make_openai_provider()
+        response = provider.client.audio.speech.with_streaming_response.create.return_value
+        response.__enter__.return_value.iter_bytes.return_value = [b'ab', b'cd']
+        output = tmp_path / 'out.mp3'
+        provider.synthesize('hello', output_file=str(output), voice='onyx')
+        assert output.read_bytes() == b'abcd'
+        response.__enter__.return_value.stream_to_file.assert_not_called()
+
+    @pytest.mark.skipif(not os.path.exists('/dev/fd'), reason='needs /dev/fd')
+    def test_output_file_into_pipe(self):
+        provider = _make_openai_provider()
+        response = provider.client.audio.speech.with_streaming_response.create.return_value
+        response.__enter__.return_value.iter_bytes.return_value = [b'ab', b'cd']
+        read_fd, write_fd = os.pipe()
+        try:
+            provider.synthesize('hello', output_file=f'/dev/fd/{write_fd}', voice='onyx')
+            os.close(write_fd)
+            write_fd = -1
+            assert os.read(read_fd, 16) == b'abcd'
+        finally:
+            for fd in (read_fd, write_fd):
+                if fd >= 0:
+                    os.close(fd)
+
+    def test_synthesize_streaming_fans_out_to_sinks(self):
+        provider = _make_openai_provider()
+        response = provider.client.audio.speech.with_streaming_response.create.return_value
+        response.__enter__.return_value.iter_bytes.return_value = [b'ab', b'cd']
+        cache_file = io.BytesIO()
+        player_stdin = MagicMock()
+        player_stdin.write.side_effect = BrokenPipeError
+        provider.synthesize_streaming('hello', [cache_file, player_stdin], voice='onyx')
+        assert cache_file.getvalue() == b'abcd'
+        # The broken sink is dropped after its first failure
+        player_stdin.write.assert_called_once_with(b'ab')
+
+    def test_incremental_requests_each_sentence_in_order(self):
+        provider = _make_openai_provider()
+        create = provider.client.audio.speech.with_streaming_response.create
+
+        def fake_create(**kwargs):
+            response = MagicMock()
+            data = kwargs['input'].encode()
+            response.__enter__.return_value.iter_bytes.return_value = [data[:2], data[2:]]
+            return response
+
+        create.side_effect = fake_create
+        player = MagicMock()
+        with patch('osay.providers.spawn_pipe_player', return_value=player):
+            provider.synthesize_incremental('One. Two! Three?', voice='onyx')
+
+        assert [c.kwargs['input'] for c in create.call_args_list] == ['One.', 'Two!', 'Three?']
+        assert all(c.kwargs['response_format'] == 'pcm' for c in create.call_args_list)
+        written = b''.join(c.args[0] for c in player.stdin.write.call_args_list)
+        assert written == b'One.Two!Three?'
+        player.stdin.close.assert_called_once()
+        player.wait.assert_called_once()
+
+    def test_incremental_surfaces_worker_errors(self):
+        provider = _make_openai_provider()
+        provider.client.audio.speech.with_streaming_response.create.side_effect = OSError('boom')
+        player = MagicMock()
+        provider._openai.AuthenticationError = type('AuthenticationError', (Exception,), {})
+        with (
+            patch('osay.providers.spawn_pipe_player', return_value=player),
+            pytest.raises(RuntimeError, match='boom'),
+        ):
+            provider.synthesize_incremental('One. Two.', voice='onyx')
+        player.kill.assert_called_once()
+
+    def test_incremental_single_sentence_uses_regular_streaming(self):
+        provider = _make_openai_provider()
+        with (
+            patch('osay.providers.spawn_pipe_player') as mock_spawn,
+            patch.object(provider, 'synthesize') as mock_synthesize,
+        ):
+            provider.synthesize_incremental('Just one sentence.', voice='onyx')
+        mock_spawn.assert_not_called()
+        mock_synthesize.assert_called_once_with('Just one sentence.', None, 'onyx', None)
+
+
+class TestSplitSentences:
+    def test_splits_on_terminal_punctuation(self):
+        assert split_sentences('Hi there. How are you?  Fine!') == [
+            'Hi there.',
+            'How are you?',
+            'Fine!',
+        ]
+
+    def test_keeps_text_without_boundaries(self):
+        assert split_sentences('  no punctuation here ') == ['no punctuation here']
+
+
+class TestSpawnPipePlayer:
+    def test_returns_none_without_ffplay(self):
+        with patch('osay.providers.shutil.which', return_value=None):
+            assert spawn_pipe_player('mp3') is None
+
+    def test_pcm_declares_raw_format(self):
+        with (
+            patch('osay.providers.shutil.which', return_value='/usr/bin/ffplay'),
+            patch('osay.providers.subprocess.Popen') as mock_popen,
+        ):
+            spawn_pipe_player('pcm')
+        cmd = mock_popen.call_args.args[0]
+        assert cmd[0] == 'ffplay'
+        assert cmd[cmd.index('-f') + 1] == 's16le'
+        assert cmd[-2:] == ['-i', 'pipe:0']
+
 
 class TestMacOSsayProvider:
     def test_synthesize_calls_say(self):